@@ -1,10 +1,9 @@
 import uvicorn
-import random
+import json
 import logging
 from contextlib import asynccontextmanager
 from fastapi import FastAPI, Request, HTTPException
-from fastapi.responses import HTMLResponse, JSONResponse
-from fastapi.staticfiles import StaticFiles
+from fastapi.responses import HTMLResponse, JSONResponse, Response
 from fastapi.templating import Jinja2Templates
 from pathlib import Path
 
@@ -12,6 +11,7 @@ from pathlib import Path
 from model_manager import load_assets, get_prediction
 from keystroke_processor import process_live_keystrokes, save_keystroke_data, TARGET_WORDS
 from pydantic_models import LivePredictionRequest, DataSubmissionRequest
+from static_assets import build_asset, build_static_assets, negotiate_encoding, etag_matches
 
 # --- Configuration ---
 BASE_DIR = Path(__file__).parent
@@ -29,32 +29,66 @@ async def lifespan(app: FastAPI):
         logger.error(f"FATAL STARTUP ERROR: {app.state.assets['error_message']}")
     else:
         logger.info("Machine learning assets loaded successfully.")
+
+    # Read and precompress static files once, so each request only picks a prepared variant
+    app.state.static = build_static_assets(BASE_DIR / "static")
+    logger.info(f"Prepared {len(app.state.static['urls'])} static assets.")
+
+    # The target words never change while the app runs, so they are served as a cacheable JSON document
+    app.state.target_words = build_asset(
+        json.dumps({"target_words": TARGET_WORDS}).encode("utf-8"),
+        "application/json",
+        cache_control="public, max-age=3600",
+    )
+
+    # Pre-render the front page; it only depends on the known styles and the hashed asset URLs
+    app.state.page = None
+    if app.state.assets["loaded"]:
+        page_html = templates.get_template("index.html").render(
+            known_styles=app.state.assets["known_styles"],
+            asset_urls=app.state.static["urls"],
+        )
+        app.state.page = build_asset(page_html.encode("utf-8"), "text/html; charset=utf-8")
     yield
     logger.info("Application shutdown...")
 
 app = FastAPI(lifespan=lifespan)
 
-# Mount the 'static' directory to serve CSS and JS files
-app.mount("/static", StaticFiles(directory=BASE_DIR / "static"), name="static")
-# Set up Jinja2 to render the HTML template
+# Set up Jinja2 to pre-render the HTML template at startup
 templates = Jinja2Templates(directory=BASE_DIR / "templates")
 
+def asset_response(asset: dict, request: Request) -> Response:
+    """Returns the best precompressed variant of an asset, or 304 if the client's copy is current."""
+    encoding = negotiate_encoding(request.headers.get("accept-encoding", ""), list(asset["variants"]))
+    etag = asset["etags"][encoding]
+    headers = {"ETag": etag, "Cache-Control": asset["cache_control"], "Vary": "Accept-Encoding"}
+
+    if etag_matches(request.headers.get("if-none-match", ""), etag):
+        return Response(status_code=304, headers=headers)
+    if encoding != "identity":
+        headers["Content-Encoding"] = encoding
+    return Response(content=asset["variants"][encoding], media_type=asset["media_type"], headers=headers)
+
 # --- API Endpoints ---
 @app.get("/", response_class=HTMLResponse)
 async def serve_frontend(request: Request):
-    """Serves the main index.html page with random words for each section."""
-    if not app.state.assets["loaded"]:
+    """Serves the pre-rendered index.html page. The target words are fetched by the page itself."""
+    if app.state.page is None:
         raise HTTPException(status_code=503, detail=f"Service Unavailable: {app.state.assets['error_message']}")
+    return asset_response(app.state.page, request)
 
-    return templates.TemplateResponse(
-        "index.html",
-        {
-            "request": request,
-            "known_styles": app.state.assets["known_styles"],
-            "live_target_word": random.choice(TARGET_WORDS),
-            "submit_target_word": random.choice(TARGET_WORDS)
-        }
-    )
+@app.get("/target_words")
+async def target_words(request: Request):
+    """Returns the list of target words the frontend picks from."""
+    return asset_response(app.state.target_words, request)
+
+@app.api_route("/static/{asset_path:path}", methods=["GET", "HEAD"])
+async def serve_static(asset_path: str, request: Request):
+    """Serves CSS and JS files from memory. Hashed paths are cached as immutable."""
+    asset = app.state.static["files"].get(asset_path)
+    if asset is None:
+        raise HTTPException(status_code=404, detail="Not Found")
+    return asset_response(asset, request)
 
 @app.post("/predict_live")
 async def predict_live(request: LivePredictionRequest):
@@ -88,5 +122,6 @@ async def submit_data(request: DataSubmissionRequest):
 
 # --- Main entry point to run the app ---
 if __name__ == "__main__":
-    uvicorn.run("main:app", host="127.0.0.1", port=8000, reload=True)
+    # Static files and the template are loaded once at startup, so also reload when they change
+    uvicorn.run("main:app", host="127.0.0.1", port=8000, reload=True, reload_includes=["*.html", "*.css", "*.js"])
 
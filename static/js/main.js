@@ -123,14 +123,39 @@ document.addEventListener('DOMContentLoaded', () => {
         }
     };
 
+    // --- Target Words ---
+    // The page is pre-rendered, so the words come from a small cacheable endpoint instead.
+    async function loadTargetWords() {
+        const response = await fetch('/target_words');
+        if (!response.ok) {
+            throw new Error(`Failed to load target words (status ${response.status}).`);
+        }
+        const data = await response.json();
+        const pickWord = () => data.target_words[Math.floor(Math.random() * data.target_words.length)];
+        document.getElementById('target-word-live').innerText = pickWord();
+        document.getElementById('target-word-submit').innerText = pickWord();
+        // The inputs stay disabled in the page until there is a word to type
+        document.getElementById('live-input').disabled = false;
+        document.getElementById('submit-input').disabled = false;
+    }
+
     // --- Initialize All Listeners ---
-    setupInputListener('live-input', 'target-word-live', handleLivePrediction);
-    
-    setupInputListener('submit-input', 'target-word-submit', (events, targetWord) => {
-        lastValidSubmission = { events, targetWord };
-        const resultDiv = document.getElementById('submit-result');
-        resultDiv.style.display = 'block';
-        resultDiv.innerHTML = `<p class="info">Typing sample captured. Ready to submit.</p>`;
+    loadTargetWords().then(() => {
+        setupInputListener('live-input', 'target-word-live', handleLivePrediction);
+
+        setupInputListener('submit-input', 'target-word-submit', (events, targetWord) => {
+            lastValidSubmission = { events, targetWord };
+            const resultDiv = document.getElementById('submit-result');
+            resultDiv.style.display = 'block';
+            resultDiv.innerHTML = `<p class="info">Typing sample captured. Ready to submit.</p>`;
+        });
+    }).catch((err) => {
+        console.error(err);
+        for (const resultId of ['live-result', 'submit-result']) {
+            const resultDiv = document.getElementById(resultId);
+            resultDiv.style.display = 'block';
+            resultDiv.innerHTML = `<p class="error"><strong>Error:</strong> Could not load the target words. Please refresh the page.</p>`;
+        }
     });
 });
 
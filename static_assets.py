@@ -0,0 +1,107 @@
+import gzip
+import hashlib
+import mimetypes
+from pathlib import Path
+from typing import Dict, Any, List
+
+# Brotli is optional: without it assets are still served gzip-compressed.
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+# Only text assets benefit from compression; images and fonts are already compressed.
+COMPRESSIBLE_TYPES = ("text/", "application/javascript", "application/json", "image/svg+xml")
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+REVALIDATE_CACHE_CONTROL = "no-cache"
+
+def build_asset(body: bytes, media_type: str, cache_control: str = REVALIDATE_CACHE_CONTROL) -> Dict[str, Any]:
+    """
+    Builds an in-memory asset with its precompressed variants and strong ETags.
+    A compressed variant is only kept when it is actually smaller than the original.
+    """
+    digest = hashlib.sha256(body).hexdigest()
+    variants = {"identity": body}
+
+    if media_type.startswith(COMPRESSIBLE_TYPES):
+        gzipped = gzip.compress(body, compresslevel=9, mtime=0)
+        if len(gzipped) < len(body):
+            variants["gzip"] = gzipped
+        if brotli is not None:
+            brotlied = brotli.compress(body, quality=11)
+            if len(brotlied) < len(body):
+                variants["br"] = brotlied
+
+    # Each encoding gets its own ETag so caches never confuse one variant for another.
+    etags = {
+        encoding: f'"{digest[:32]}"' if encoding == "identity" else f'"{digest[:32]}-{encoding}"'
+        for encoding in variants
+    }
+
+    return {
+        "variants": variants,
+        "etags": etags,
+        "media_type": media_type,
+        "digest": digest,
+        "cache_control": cache_control,
+    }
+
+def build_static_assets(static_dir: Path) -> Dict[str, Any]:
+    """
+    Reads every file under the static directory once and precompresses it.
+    Each file is registered under a content-hashed path (served as immutable) and
+    under its original path (served with revalidation) for backwards compatibility.
+    """
+    files = {}
+    urls = {}
+    for file_path in sorted(p for p in static_dir.rglob("*") if p.is_file()):
+        relative_path = file_path.relative_to(static_dir).as_posix()
+        media_type = mimetypes.guess_type(file_path.name)[0] or "application/octet-stream"
+        if media_type.startswith("text/") or media_type == "application/javascript":
+            media_type = f"{media_type}; charset=utf-8"
+        body = file_path.read_bytes()
+
+        asset = build_asset(body, media_type)
+        hashed_path = f"{Path(relative_path).with_suffix('').as_posix()}.{asset['digest'][:12]}{file_path.suffix}"
+
+        files[relative_path] = asset
+        files[hashed_path] = {**asset, "cache_control": IMMUTABLE_CACHE_CONTROL}
+        urls[relative_path] = f"/static/{hashed_path}"
+
+    return {"files": files, "urls": urls}
+
+def negotiate_encoding(accept_encoding: str, available: List[str]) -> str:
+    """
+    Picks the best available content encoding for an Accept-Encoding header.
+    The encoding with the highest q-value wins, with brotli preferred over gzip on a tie.
+    Anything with q=0 or a malformed q-value is treated as refused.
+    """
+    accepted = {}
+    for part in accept_encoding.split(","):
+        name, *params = part.split(";")
+        name = name.strip().lower()
+        if not name:
+            continue
+        quality = 1.0
+        for param in params:
+            key, _, value = param.partition("=")
+            if key.strip().lower() == "q":
+                try:
+                    quality = float(value.strip())
+                except ValueError:
+                    quality = 0.0
+        accepted[name] = quality
+
+    best_encoding, best_quality = "identity", 0.0
+    for encoding in ("br", "gzip"):
+        quality = accepted.get(encoding, accepted.get("*", 0.0))
+        if encoding in available and quality > best_quality:
+            best_encoding, best_quality = encoding, quality
+    return best_encoding
+
+def etag_matches(if_none_match: str, etag: str) -> bool:
+    """Checks an If-None-Match header against an ETag, using weak comparison."""
+    if if_none_match.strip() == "*":
+        return True
+    candidates = [tag.strip().removeprefix("W/") for tag in if_none_match.split(",")]
+    return etag in candidates
@@ -0,0 +1,58 @@
+import gzip
+import json
+
+import pytest
+
+pytest.importorskip("fastapi")
+pytest.importorskip("httpx")
+
+from fastapi.testclient import TestClient
+
+from main import app
+from keystroke_processor import TARGET_WORDS
+
+@pytest.fixture(scope="module")
+def client():
+    # Entering the client runs the lifespan, which builds the in-memory assets
+    with TestClient(app) as test_client:
+        yield test_client
+
+def test_hashed_static_asset_is_compressed_and_immutable(client):
+    hashed_url = app.state.static["urls"]["js/main.js"]
+    response = client.get(hashed_url, headers={"Accept-Encoding": "gzip"})
+
+    assert response.status_code == 200
+    assert response.headers["content-encoding"] == "gzip"
+    assert "immutable" in response.headers["cache-control"]
+    assert response.headers["vary"] == "Accept-Encoding"
+    # httpx transparently decodes gzip, so compare against the file on disk
+    assert response.content == app.state.static["files"]["js/main.js"]["variants"]["identity"]
+    assert gzip.decompress(app.state.static["files"]["js/main.js"]["variants"]["gzip"]) == response.content
+
+def test_original_static_path_revalidates_with_etag(client):
+    response = client.get("/static/css/style.css", headers={"Accept-Encoding": "identity"})
+    assert response.status_code == 200
+    assert "content-encoding" not in response.headers
+    assert response.headers["cache-control"] == "no-cache"
+
+    etag = response.headers["etag"]
+    cached = client.get("/static/css/style.css", headers={"Accept-Encoding": "identity", "If-None-Match": etag})
+    assert cached.status_code == 304
+    assert cached.content == b""
+    assert cached.headers["etag"] == etag
+
+def test_static_head_request(client):
+    response = client.head("/static/css/style.css", headers={"Accept-Encoding": "gzip"})
+    assert response.status_code == 200
+    assert response.headers["content-encoding"] == "gzip"
+    assert response.content == b""
+
+def test_unknown_static_asset_returns_404(client):
+    assert client.get("/static/missing.js").status_code == 404
+
+def test_target_words_endpoint(client):
+    response = client.get("/target_words")
+    assert response.status_code == 200
+    assert json.loads(response.content) == {"target_words": TARGET_WORDS}
+    assert response.headers["cache-control"] == "public, max-age=3600"
+    assert "etag" in response.headers
@@ -0,0 +1,45 @@
+import pytest
+
+from static_assets import build_asset, negotiate_encoding, etag_matches
+
+ALL_ENCODINGS = ["identity", "gzip", "br"]
+
+@pytest.mark.parametrize("header, available, expected", [
+    ("gzip, deflate, br", ALL_ENCODINGS, "br"),
+    ("gzip, deflate, br", ["identity", "gzip"], "gzip"),
+    ("gzip;q=0.5, br;q=1", ["identity", "gzip"], "gzip"),
+    ("br;q=0.1, gzip;q=1", ALL_ENCODINGS, "gzip"),
+    ("br;q=0.8, gzip;q=0.8", ALL_ENCODINGS, "br"),
+    ("gzip; q=0", ALL_ENCODINGS, "identity"),
+    ("br;q=0, gzip", ALL_ENCODINGS, "gzip"),
+    ("*", ALL_ENCODINGS, "br"),
+    ("*;q=0.5, br;q=0", ALL_ENCODINGS, "gzip"),
+    ("GZIP, BR;Q=0.5", ALL_ENCODINGS, "gzip"),
+    ("gzip;q=abc", ALL_ENCODINGS, "identity"),
+    ("deflate", ALL_ENCODINGS, "identity"),
+    ("", ALL_ENCODINGS, "identity"),
+])
+def test_negotiate_encoding(header, available, expected):
+    assert negotiate_encoding(header, available) == expected
+
+@pytest.mark.parametrize("header, expected", [
+    ('"abc"', True),
+    ('W/"abc"', True),
+    ('"xyz", W/"abc"', True),
+    ("*", True),
+    ('"xyz"', False),
+    ("", False),
+])
+def test_etag_matches(header, expected):
+    assert etag_matches(header, '"abc"') is expected
+
+def test_build_asset_keeps_only_smaller_variants():
+    compressible = build_asset(b"a" * 1000, "text/css; charset=utf-8")
+    assert "gzip" in compressible["variants"]
+    assert len(set(compressible["etags"].values())) == len(compressible["variants"])
+
+    tiny = build_asset(b"a", "text/css; charset=utf-8")
+    assert list(tiny["variants"]) == ["identity"]
+
+    binary = build_asset(b"a" * 1000, "image/png")
+    assert list(binary["variants"]) == ["identity"]